@@ -1,9 +1,15 @@
 """UIABot Telegram bot package."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .config import BotConfig, Engineer, load_config
 from .database import Database
-from .ai import AIAssistant
-from .handlers import build_application
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from .ai import AIAssistant
+    from .handlers import build_application
 
 __all__ = [
     "BotConfig",
@@ -13,3 +19,17 @@ __all__ = [
     "AIAssistant",
     "build_application",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # ``AIAssistant`` pulls in the OpenAI SDK and ``build_application`` pulls in
+    # python-telegram-bot, so both are only imported on first access (PEP 562).
+    if name == "AIAssistant":
+        from .ai import AIAssistant
+
+        return AIAssistant
+    if name == "build_application":
+        from .handlers import build_application
+
+        return build_application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
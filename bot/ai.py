@@ -2,39 +2,223 @@
 
 from __future__ import annotations
 
-from openai import OpenAI
+import asyncio
+import hashlib
+import random
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    import httpx
+
+
+# Static prompt parts come first so OpenAI's automatic prefix cache can reuse
+# them across requests; only the ticket-specific fields are appended per call.
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful Mongolian IT support assistant.",
+}
+
+_INSTRUCTION_PREFIX = (
+    "Та боловсролын байгууллагын мэдээллийн технологийн дэмжлэгийн инженер. "
+    "Доорх мэдээллийг ашиглаад хэрэглэгчийн асуудлыг шийдвэрлэхэд зориулсан "
+    "5-8 алхам бүхий дэлгэрэнгүй зааварчилгаа боловсруулна уу. Алхам бүрийг "
+    "1., 2. гэж дугаарласан жагсаалтаар харуулж, энгийн монгол хэлээр тайлбарлаарай.\n"
+)
+
+_CACHE_SIZE = 512
+
+# Retry policy for transient API failures (full-jitter exponential backoff).
+_MAX_RETRIES = 5
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30.0
+
+
+def _default_http_client() -> "httpx.AsyncClient":
+    import httpx
+
+    limits = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+    try:  # Optional aiohttp-backed transport, scales better under high concurrency.
+        from httpx_aiohttp import HttpxAiohttpClient
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+    else:
+        return HttpxAiohttpClient(limits=limits)
+
+    try:  # Optional HTTP/2 support multiplexes concurrent requests per connection.
+        import h2  # noqa: F401
+    except ImportError:  # pragma: no cover - optional dependency
+        return httpx.AsyncClient(limits=limits)
+    return httpx.AsyncClient(limits=limits, http2=True)
+
+
+def _cache_key(issue_type: str, description: str) -> str:
+    normalized = " ".join(description.casefold().split())
+    return hashlib.sha1(f"{issue_type}\n{normalized}".encode("utf-8")).hexdigest()
 
 
 class AIAssistant:
     """Thin wrapper around the OpenAI chat completions API."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini") -> None:
-        self._client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        http_client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 32,
+    ) -> None:
+        # ``openai`` (and ``httpx``) are imported here rather than at module
+        # level; they dominate the package's import time.
+        from openai import APIConnectionError, AsyncOpenAI, RateLimitError
+
+        # A single pooled HTTP client is shared by every request so that
+        # concurrent tickets reuse keep-alive connections.
+        self._http_client = http_client or _default_http_client()
+        # Retries are handled by ``_create`` so the SDK's own retry loop is
+        # disabled to avoid multiplying attempts.
+        self._client = AsyncOpenAI(
+            api_key=api_key, http_client=self._http_client, max_retries=0
+        )
         self._model = model
+        self._retryable_errors = (RateLimitError, APIConnectionError)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future[str]] = {}
+
+    @property
+    def busy(self) -> bool:
+        """Whether every concurrent API slot is taken, so a new request will queue."""
+
+        return self._semaphore.locked()
 
-    def generate_guidance(self, issue_type: str, description: str) -> str:
-        """Generate a step-by-step troubleshooting guide."""
+    async def generate_guidance(self, issue_type: str, description: str) -> str:
+        """Generate a step-by-step troubleshooting guide.
 
+        Identical tickets (same issue type and description, ignoring case and
+        whitespace) are answered from a bounded in-process LRU cache, and
+        identical tickets arriving concurrently share a single API call.
+        """
+
+        key = _cache_key(issue_type, description)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        with self._single_flight(key) as future:
+            async with self._semaphore:
+                response = await self._create(self._messages(issue_type, description))
+            guidance = response.choices[0].message.content.strip()
+            self._publish(key, future, guidance)
+        return guidance
+
+    async def stream_guidance(
+        self, issue_type: str, description: str
+    ) -> AsyncIterator[str]:
+        """Yield the troubleshooting guide incrementally as it is generated.
+
+        Cache hits, and tickets identical to one already being generated, are
+        yielded as a single chunk once the text is complete.
+        """
+
+        key = _cache_key(issue_type, description)
+        cached = self._cached(key)
+        if cached is not None:
+            yield cached
+            return
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            yield await asyncio.shield(pending)
+            return
+
+        with self._single_flight(key) as future:
+            parts: List[str] = []
+            async with self._semaphore:
+                stream = await self._create(
+                    self._messages(issue_type, description), stream=True
+                )
+                # Closed explicitly so an abandoned generator (timeout,
+                # cancellation, a failing consumer) releases the connection
+                # right away instead of at garbage collection.
+                try:
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            parts.append(delta)
+                            yield delta
+                finally:
+                    await stream.close()
+
+            self._publish(key, future, "".join(parts).strip())
+
+    async def _create(self, messages: List[Dict[str, str]], **kwargs: Any) -> Any:
+        """Call the chat completions API, retrying rate-limit and network errors."""
+
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                return await self._client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    temperature=0.3,
+                    **kwargs,
+                )
+            except self._retryable_errors:
+                if attempt == _MAX_RETRIES:
+                    raise
+                delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt)
+                await asyncio.sleep(random.uniform(0, delay))
+
+    def _messages(self, issue_type: str, description: str) -> List[Dict[str, str]]:
         prompt = (
-            "Та боловсролын байгууллагын мэдээллийн технологийн дэмжлэгийн инженер. "
-            "Доорх мэдээллийг ашиглаад хэрэглэгчийн асуудлыг шийдвэрлэхэд зориулсан "
-            "5-8 алхам бүхий дэлгэрэнгүй зааварчилгаа боловсруулна уу. Алхам бүрийг "
-            "1., 2. гэж дугаарласан жагсаалтаар харуулж, энгийн монгол хэлээр тайлбарлаарай.\n\n"
-            f"Асуудлын төрөл: {issue_type}\n"
-            f"Хэрэглэгчийн тайлбар: {description}\n"
+            _INSTRUCTION_PREFIX
+            + f"\nАсуудлын төрөл: {issue_type}\nХэрэглэгчийн тайлбар: {description}\n"
         )
+        return [_SYSTEM_MSG, {"role": "user", "content": prompt}]
 
-        response = self._client.chat.completions.create(
-            model=self._model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful Mongolian IT support assistant.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.3,
-        )
+    def _cached(self, key: str) -> str | None:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _publish(self, key: str, future: asyncio.Future[str], guidance: str) -> None:
+        # Raised inside ``_single_flight`` so waiters get the error and an
+        # empty reply is never cached.
+        if not guidance:
+            raise RuntimeError("the model returned no guidance")
+        self._cache[key] = guidance
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+        future.set_result(guidance)
+
+    @contextmanager
+    def _single_flight(self, key: str) -> Iterator[asyncio.Future[str]]:
+        """Register an in-flight request so concurrent duplicates can await it."""
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            yield future
+        except BaseException as exc:
+            if not future.done():
+                if not isinstance(exc, Exception):
+                    exc = RuntimeError("guidance request was aborted")
+                future.set_exception(exc)
+                # Waiters still receive the error; this only silences the
+                # "exception was never retrieved" warning when there are none.
+                future.exception()
+            raise
+        finally:
+            del self._inflight[key]
 
-        return response.choices[0].message.content.strip()
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
 
+        await self._http_client.aclose()
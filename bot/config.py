@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 from dataclasses import dataclass
-from typing import List, Set
+from typing import FrozenSet, List, NamedTuple, Tuple
 
+try:  # Optional C-accelerated JSON parser.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
 
-@dataclass(frozen=True)
-class Engineer:
+
+class Engineer(NamedTuple):
     """Represents an engineer who can receive escalated tickets."""
 
     name: str
     chat_id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BotConfig:
     """Holds configuration for the Telegram bot."""
 
@@ -24,17 +30,40 @@ class BotConfig:
     openai_api_key: str
     openai_model: str
     manager_chat_id: int
-    engineers: List[Engineer]
-    employee_codes: Set[str]
+    engineers: Tuple[Engineer, ...]
+    employee_codes: FrozenSet[str]
     database_path: str = "data/bot.db"
-
-
-def _load_engineers(raw: str | None) -> List[Engineer]:
+    openai_max_concurrency: int = 32
+    openai_timeout: float = 60.0
+    database_flush_interval: float = 0.0
+    webhook_url: str | None = None
+    webhook_listen: str = "0.0.0.0"
+    webhook_port: int = 8443
+    webhook_secret: str | None = None
+
+
+# One ``KEY=VALUE`` assignment per line, optionally prefixed with ``export``.
+# This is the same grammar the original line-by-line parser accepted: lines
+# starting with ``#`` are comments, the key is everything before the first
+# ``=`` (surrounding blanks stripped), and the value is the rest of the line.
+# Matching surrounding quotes are peeled in ``load_env_file``; there are no
+# escape sequences. The pattern runs over raw bytes so only the matched groups
+# are decoded.
+_ENV_LINE = re.compile(
+    rb"^(?![^\S\n]*#)[^\S\n]*(?:export[^\S\n]+)?"
+    rb"([^=\n]*?)[^\S\n]*=[^\S\n]*([^\n]*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_engineers(raw: str | None) -> Tuple[Engineer, ...]:
+    # A tuple, because the cached result is shared by every caller.
     if not raw:
-        return []
+        return ()
 
     try:
-        payload = json.loads(raw)
+        payload = _json_loads(raw)
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive
         raise ValueError(
             "ENGINEERS environment variable must contain valid JSON"
@@ -42,32 +71,33 @@ def _load_engineers(raw: str | None) -> List[Engineer]:
 
     engineers: List[Engineer] = []
     for item in payload:
-        if "name" not in item or "chat_id" not in item:
+        if not isinstance(item, dict):
+            raise ValueError("Each engineer definition must be a JSON object")
+        name = item.get("name")
+        chat_id = item.get("chat_id")
+        if name is None or chat_id is None:
             raise ValueError(
                 "Each engineer definition must contain 'name' and 'chat_id' keys"
             )
-        engineers.append(Engineer(name=str(item["name"]), chat_id=int(item["chat_id"])))
-    return engineers
+        engineers.append(Engineer(name=str(name), chat_id=int(chat_id)))
+    return tuple(engineers)
 
 
-def _load_employee_codes(raw: str | None) -> Set[str]:
+@functools.lru_cache(maxsize=8)
+def _load_employee_codes(raw: str | None) -> FrozenSet[str]:
     if not raw:
-        return set()
+        return frozenset()
 
     try:
-        payload = json.loads(raw)
+        payload = _json_loads(raw)
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive
         raise ValueError(
             "EMPLOYEE_CODES environment variable must contain valid JSON"
         ) from exc
 
-    if isinstance(payload, list):
-        codes = {str(item).strip() for item in payload if str(item).strip()}
-        return codes
-
-    if isinstance(payload, dict):
-        codes = {str(key).strip() for key, value in payload.items() if str(key).strip()}
-        return codes
+    # A JSON object contributes its keys; iterating a dict yields exactly those.
+    if isinstance(payload, (list, dict)):
+        return frozenset(code for item in payload if (code := str(item).strip()))
 
     raise ValueError(
         "EMPLOYEE_CODES environment variable must be a JSON array or object"
@@ -77,8 +107,9 @@ def _load_employee_codes(raw: str | None) -> Set[str]:
 def load_env_file(path: str) -> None:
     """Load environment variables from a ``.env`` style file.
 
-    The parser is intentionally minimal: blank lines and comments are ignored,
-    keys and values are stripped from surrounding whitespace, quoted values are
+    The parser is intentionally minimal and runs a single pre-compiled regular
+    expression over the whole file: blank lines and comments are ignored, keys
+    and values are stripped from surrounding whitespace, quoted values are
     unwrapped, and values for keys that already exist in ``os.environ`` are not
     overwritten ("first wins").
 
@@ -90,35 +121,31 @@ def load_env_file(path: str) -> None:
     if not os.path.exists(path):
         return
 
-    with open(path, "r", encoding="utf-8") as handle:
-        for raw_line in handle:
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            if line.startswith("export"):
-                remainder = line[6:]
-                if remainder and remainder[0].isspace():
-                    line = remainder.lstrip()
+    with open(path, "rb") as handle:
+        contents = handle.read()
+    if b"\r" in contents:  # Same line endings as text mode's universal newlines.
+        contents = contents.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
-            if "=" not in line:
-                continue
+    for match in _ENV_LINE.finditer(contents):
+        raw_key, raw_value = match.groups()
+        key = raw_key.decode("utf-8")
+        if not key or key in os.environ:
+            continue
 
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
+        value = raw_value.decode("utf-8")
+        if value and value[0] == value[-1] and value[0] in ("'", '"'):
+            value = value[1:-1]
 
-            if not key or key in os.environ:
-                continue
-
-            if value and value[0] == value[-1] and value[0] in ("'", '"'):
-                value = value[1:-1]
-
-            os.environ[key] = value
+        os.environ[key] = value
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> BotConfig:
-    """Load configuration from environment variables."""
+    """Load configuration from environment variables.
+
+    The result is memoised for the lifetime of the process; call
+    ``load_config.cache_clear()`` after changing the environment.
+    """
 
     telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN")
     if not telegram_token:
@@ -134,14 +161,30 @@ def load_config() -> BotConfig:
     manager_chat_id = int(manager_raw)
 
     openai_model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+    openai_max_concurrency = int(os.environ.get("OPENAI_MAX_CONCURRENCY", "32"))
+    if openai_max_concurrency < 1:
+        raise ValueError("OPENAI_MAX_CONCURRENCY must be a positive integer")
+    openai_timeout = float(os.environ.get("OPENAI_TIMEOUT", "60"))
+    if openai_timeout <= 0:
+        raise ValueError("OPENAI_TIMEOUT must be a positive number of seconds")
     engineers = _load_engineers(os.environ.get("ENGINEERS"))
     employee_codes = _load_employee_codes(os.environ.get("EMPLOYEE_CODES"))
 
     db_path = os.environ.get("DATABASE_PATH", "data/bot.db")
+    db_flush_interval = float(os.environ.get("DATABASE_FLUSH_INTERVAL", "0"))
+    if db_flush_interval < 0:
+        raise ValueError("DATABASE_FLUSH_INTERVAL must not be negative")
     db_dir = os.path.dirname(db_path)
     if db_dir:
         os.makedirs(db_dir, exist_ok=True)
 
+    webhook_url = os.environ.get("WEBHOOK_URL") or None
+    webhook_listen = os.environ.get("WEBHOOK_LISTEN", "0.0.0.0")
+    webhook_port = int(os.environ.get("WEBHOOK_PORT", "8443"))
+    if not 0 < webhook_port < 65536:
+        raise ValueError("WEBHOOK_PORT must be a valid TCP port")
+    webhook_secret = os.environ.get("WEBHOOK_SECRET") or None
+
     return BotConfig(
         telegram_token=telegram_token,
         openai_api_key=openai_api_key,
@@ -150,5 +193,12 @@ def load_config() -> BotConfig:
         engineers=engineers,
         employee_codes=employee_codes,
         database_path=db_path,
+        openai_max_concurrency=openai_max_concurrency,
+        openai_timeout=openai_timeout,
+        database_flush_interval=db_flush_interval,
+        webhook_url=webhook_url,
+        webhook_listen=webhook_listen,
+        webhook_port=webhook_port,
+        webhook_secret=webhook_secret,
     )
 
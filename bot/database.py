@@ -2,23 +2,204 @@
 
 from __future__ import annotations
 
+import queue
 import sqlite3
 import threading
+import time
+from collections import Counter
 from contextlib import contextmanager
-from datetime import datetime
-from typing import Dict, Iterable
+from datetime import date, datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
-class Database:
-    """Thin wrapper around SQLite to store calls and assignments."""
+# WAL lets readers proceed while a write is in progress. The journal mode is
+# stored in the database file, so it is set once through the writer.
+_JOURNAL_PRAGMA = "PRAGMA journal_mode=WAL"
+
+# Per-connection settings applied to the writer and every reader.
+# synchronous=NORMAL is durable enough under WAL while saving an fsync per
+# commit.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Bumped whenever ``_initialise`` gains a migration; stored in the database
+# header via ``PRAGMA user_version``.
+_SCHEMA_VERSION = 1
+
+# Size of each connection's prepared-statement cache. Every query in this
+# module is a fixed SQL literal, so all of them stay prepared.
+_CACHED_STATEMENTS = 256
+
+
+def _connect(database: str, **kwargs: object) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        database,
+        check_same_thread=False,
+        cached_statements=_CACHED_STATEMENTS,
+        **kwargs,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _day_range(first: date, last: date) -> Tuple[str, str]:
+    """Return a half-open ``[start, end)`` bound covering whole days.
+
+    ``created_at`` is stored as ``YYYY-MM-DD HH:MM:SS`` text, which sorts
+    lexicographically, so comparing against bare dates matches the same rows
+    as filtering on the ``DATE()`` of the column but can use an index.
+    """
+
+    return first.isoformat(), (last + timedelta(days=1)).isoformat()
+
+
+def _summarise(rows: List[sqlite3.Row]) -> Dict[str, object]:
+    """Fold ``(department, issue_type, status, count)`` groups into totals."""
+
+    by_department: Counter[str] = Counter()
+    by_issue: Counter[str] = Counter()
+    statuses: Counter[str] = Counter()
+    for department, issue_type, status, count in rows:
+        by_department[department] += count
+        by_issue[issue_type] += count
+        statuses[status] += count
+
+    return {
+        "total": sum(statuses.values()),
+        "by_department": sorted(by_department.items()),
+        "by_issue": sorted(by_issue.items()),
+        "statuses": sorted(statuses.items()),
+    }
+
+
+# Report summaries are served from memory for this many seconds unless a
+# write through this object invalidates them first.
+_SUMMARY_TTL = 5.0
+_SUMMARY_CACHE_SIZE = 64
 
-    def __init__(self, path: str) -> None:
+# Employee records only change through ``add_employee``, so lookups (including
+# misses) are memoised until that code is written again.
+_EMPLOYEE_CACHE_SIZE = 1024
+
+# Today's per-engineer loads only change when a call is (re)assigned, so they
+# are reused until then; the TTL bounds staleness from writers in other
+# processes.
+_LOADS_TTL = 60.0
+
+# Statuses of calls closed by the user; these can no longer be assigned.
+_CLOSED_STATUSES = frozenset({"resolved_with_basic", "resolved_with_ai"})
+
+
+class Database:
+    """Thin wrapper around SQLite to store calls and assignments.
+
+    Writes go through a single read-write connection guarded by a lock, while
+    read-only queries check out one of a small pool of ``mode=ro``
+    connections so reporting does not queue behind writers.
+
+    With ``flush_interval`` set, the live database is instead held in memory
+    and copied to ``path`` by a background thread every ``flush_interval``
+    seconds (and on ``close``). Writes made since the last flush are lost if
+    the process dies, so this mode only suits small databases where that is
+    acceptable.
+    """
+
+    def __init__(
+        self, path: str, readers: int = 4, flush_interval: float | None = None
+    ) -> None:
         self._path = path
-        self._lock = threading.Lock()
+        # Re-entrant so CRUD helpers can run inside ``transaction()``.
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._summary_cache: Dict[
+            Optional[Tuple[str, str]], Tuple[float, Dict[str, object]]
+        ] = {}
+        # (valid-until timestamp, today's range) for the reporting queries.
+        self._today: Tuple[float, Tuple[str, str]] | None = None
+        # Bumped by every employee write so a lookup racing it never stores
+        # the row it read before the write.
+        self._employee_cache: Dict[str, Optional[Dict[str, str]]] = {}
+        self._employee_generation = 0
+        # (stored-at, today's range, loads) plus a generation counter so a
+        # query racing an assignment never stores its stale result.
+        self._loads: Tuple[float, Tuple[str, str], Dict[str, int]] | None = None
+        self._loads_generation = 0
+        self._assignments_changed = False
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._disk: sqlite3.Connection | None = None
+        self._dirty = False
+        self._flusher: threading.Thread | None = None
+        self._closing = threading.Event()
+
+        if flush_interval:
+            self._disk = _connect(path)
+            self._disk.execute(_JOURNAL_PRAGMA)
+            self._writer = _connect(":memory:")
+            self._disk.backup(self._writer)
+            self._initialise()
+            self.flush()
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name="database-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+            return
+
+        self._writer = _connect(path)
+        self._writer.execute(_JOURNAL_PRAGMA)
         self._initialise()
 
+        reader_uri = Path(path).resolve().as_uri() + "?mode=ro"
+        for _ in range(readers):
+            self._readers.put(_connect(reader_uri, uri=True))
+
+    def close(self) -> None:
+        self._closing.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if self._disk is not None:
+                self.flush()
+                self._disk.close()
+            self._writer.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    def flush(self) -> None:
+        """Copy the in-memory database to disk if it changed since the last flush.
+
+        Does nothing unless the database was opened with ``flush_interval``.
+        """
+
+        if self._disk is None:
+            return
+        with self._lock:
+            if self._dirty:
+                self._writer.backup(self._disk)
+                self._dirty = False
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._closing.wait(interval):
+            self.flush()
+
     def _initialise(self) -> None:
-        with self._get_connection() as conn:
+        # A database stamped with the current schema version needs no DDL or
+        # column checks; older files run the idempotent migration once.
+        version = self._writer.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+
+        with self._write_connection() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS calls (
@@ -38,15 +219,9 @@ class Database:
                 )
                 """
             )
-            conn.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS trg_calls_updated
-                AFTER UPDATE ON calls
-                BEGIN
-                    UPDATE calls SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
-                END;
-                """
-            )
+            # ``updated_at`` is set by each UPDATE statement directly; the old
+            # trigger doubled the write work of every update.
+            conn.execute("DROP TRIGGER IF EXISTS trg_calls_updated")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS employee_codes (
@@ -56,7 +231,15 @@ class Database:
                 )
                 """
             )
-            conn.commit()
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_calls_engineer_date
+                    ON calls (assigned_engineer, created_at)
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_calls_created_at ON calls (created_at)"
+            )
 
             columns = {
                 row[1]
@@ -66,7 +249,6 @@ class Database:
                 conn.execute(
                     "ALTER TABLE calls ADD COLUMN employee_code TEXT"
                 )
-                conn.commit()
 
             employee_columns = {
                 row[1]
@@ -76,22 +258,25 @@ class Database:
                 conn.execute(
                     "ALTER TABLE employee_codes ADD COLUMN department TEXT"
                 )
-                conn.commit()
+
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     def has_employee_codes(self) -> bool:
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM employee_codes LIMIT 1"
-            )
-            return cursor.fetchone() is not None
+        with self._read_connection() as conn:
+            cursor = conn.execute("SELECT EXISTS(SELECT 1 FROM employee_codes)")
+            return bool(cursor.fetchone()[0])
 
     def is_employee_code_allowed(self, code: str) -> bool:
-        with self._get_connection() as conn:
+        try:  # The cache may be cleared by another thread between two lookups.
+            return self._employee_cache[code] is not None
+        except KeyError:
+            pass
+        with self._read_connection() as conn:
             cursor = conn.execute(
-                "SELECT 1 FROM employee_codes WHERE code = ?",
+                "SELECT EXISTS(SELECT 1 FROM employee_codes WHERE code = ?)",
                 (code,),
             )
-            return cursor.fetchone() is not None
+            return bool(cursor.fetchone()[0])
 
     def add_employee(self, code: str, full_name: str, department: str | None) -> bool:
         """Add or update an employee record.
@@ -102,49 +287,129 @@ class Database:
 
         department = department.strip() if department else None
 
-        with self._get_connection() as conn:
-            existing = conn.execute(
-                "SELECT 1 FROM employee_codes WHERE code = ?",
-                (code,),
-            ).fetchone()
-            conn.execute(
+        with self._write_connection() as conn:
+            # Try the insert first; only an existing code falls through to the
+            # update, so new employees cost a single statement.
+            created = conn.execute(
                 """
                 INSERT INTO employee_codes (code, full_name, department)
                 VALUES (?, ?, ?)
-                ON CONFLICT(code) DO UPDATE
-                    SET full_name = excluded.full_name,
-                        department = COALESCE(excluded.department, employee_codes.department)
+                ON CONFLICT(code) DO NOTHING
                 """,
                 (code, full_name, department),
-            )
-            conn.commit()
-            return existing is None
+            ).rowcount > 0
+            if not created:
+                conn.execute(
+                    """
+                    UPDATE employee_codes
+                       SET full_name = ?,
+                           department = COALESCE(?, department)
+                     WHERE code = ?
+                    """,
+                    (full_name, department, code),
+                )
+        self._employee_generation += 1
+        self._employee_cache.pop(code, None)
+        return created
 
     def get_employee(self, code: str) -> Dict[str, str] | None:
-        with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT code, full_name, department FROM employee_codes WHERE code = ?",
-                (code,),
-            ).fetchone()
+        try:
+            employee = self._employee_cache[code]
+        except KeyError:
+            generation = self._employee_generation
+            with self._read_connection() as conn:
+                row = conn.execute(
+                    "SELECT code, full_name, department FROM employee_codes WHERE code = ?",
+                    (code,),
+                ).fetchone()
+            employee = dict(row) if row is not None else None
+            if generation == self._employee_generation:
+                if len(self._employee_cache) >= _EMPLOYEE_CACHE_SIZE:
+                    self._employee_cache.clear()
+                self._employee_cache[code] = employee
+
+        return dict(employee) if employee is not None else None
 
-        if row is None:
-            return None
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into a single ``BEGIN IMMEDIATE`` transaction.
 
-        return {
-            "code": row["code"],
-            "full_name": row["full_name"],
-            "department": row["department"],
-        }
+        CRUD helpers called inside the block skip their own commit; the whole
+        block is committed on exit or rolled back if it raises. Nested blocks
+        join the outermost transaction.
+        """
+
+        with self._lock:
+            outermost = self._transaction_depth == 0
+            if outermost:
+                self._writer.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                if outermost:
+                    self._writer.rollback()
+                raise
+            else:
+                if outermost:
+                    self._writer.commit()
+            finally:
+                self._transaction_depth -= 1
+                self._after_write()
 
     @contextmanager
-    def _get_connection(self) -> Iterable[sqlite3.Connection]:
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
         with self._lock:
-            conn = sqlite3.connect(self._path)
-            conn.row_factory = sqlite3.Row
             try:
-                yield conn
+                yield self._writer
+            except BaseException:
+                if self._transaction_depth == 0:
+                    self._writer.rollback()
+                raise
+            else:
+                if self._transaction_depth == 0:
+                    self._writer.commit()
             finally:
-                conn.close()
+                self._dirty = True
+                self._after_write()
+
+    def _after_write(self) -> None:
+        self._summary_cache.clear()
+        # Assignments inside a transaction become visible at its commit.
+        if self._assignments_changed and self._transaction_depth == 0:
+            self._assignments_changed = False
+            self._loads_generation += 1
+            self._loads = None
+
+    def _cached_summary(
+        self, key: Optional[Tuple[str, str]]
+    ) -> Dict[str, object] | None:
+        entry = self._summary_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= _SUMMARY_TTL:
+            return None
+        return entry[1]
+
+    def _store_summary(
+        self, key: Optional[Tuple[str, str]], summary: Dict[str, object]
+    ) -> Dict[str, object]:
+        if len(self._summary_cache) >= _SUMMARY_CACHE_SIZE:
+            self._summary_cache.clear()
+        self._summary_cache[key] = (time.monotonic(), summary)
+        return summary
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        if self._disk is not None:
+            # In-memory mode has a single connection; reads are cheap enough
+            # to share the writer lock.
+            with self._lock:
+                yield self._writer
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
 
     # CRUD helpers ---------------------------------------------------------
     def create_call(
@@ -156,7 +421,7 @@ class Database:
         employee_code: str | None,
         basic_guidance: str,
     ) -> int:
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO calls (
@@ -179,57 +444,98 @@ class Database:
                     "basic_guidance_provided",
                 ),
             )
-            conn.commit()
             return int(cursor.lastrowid)
 
-    def update_issue_description(self, call_id: int, description: str) -> None:
-        with self._get_connection() as conn:
+    def record_issue_description(
+        self, call_id: int, description: str, status: str
+    ) -> None:
+        """Store the issue description and move the call to ``status`` at once."""
+
+        with self._write_connection() as conn:
             conn.execute(
-                "UPDATE calls SET issue_description = ? WHERE id = ?",
-                (description, call_id),
+                """
+                UPDATE calls
+                   SET issue_description = ?,
+                       status = ?,
+                       updated_at = CURRENT_TIMESTAMP
+                 WHERE id = ?
+                """,
+                (description, status, call_id),
             )
-            conn.commit()
 
     def update_ai_guidance(self, call_id: int, guidance: str) -> None:
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             conn.execute(
-                "UPDATE calls SET ai_guidance = ?, status = ? WHERE id = ?",
+                """
+                UPDATE calls
+                   SET ai_guidance = ?,
+                       status = ?,
+                       updated_at = CURRENT_TIMESTAMP
+                 WHERE id = ?
+                """,
                 (guidance, "ai_guidance_provided", call_id),
             )
-            conn.commit()
 
     def mark_status(self, call_id: int, status: str) -> None:
-        with self._get_connection() as conn:
-            conn.execute("UPDATE calls SET status = ? WHERE id = ?", (status, call_id))
-            conn.commit()
+        with self._write_connection() as conn:
+            conn.execute(
+                "UPDATE calls SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (status, call_id),
+            )
 
     def assign_engineer(self, call_id: int, engineer_name: str) -> None:
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             conn.execute(
-                "UPDATE calls SET assigned_engineer = ?, status = ? WHERE id = ?",
+                """
+                UPDATE calls
+                   SET assigned_engineer = ?,
+                       status = ?,
+                       updated_at = CURRENT_TIMESTAMP
+                 WHERE id = ?
+                """,
                 (engineer_name, "escalated_to_engineer", call_id),
             )
-            conn.commit()
+            self._assignments_changed = True
+
+    def assign_open_call(
+        self, call_id: int, engineer_name: str
+    ) -> Tuple[Dict[str, object] | None, int | None]:
+        """Assign an engineer to a call that has not been closed.
+
+        Returns the call details as read before the update, and the engineer's
+        call count for today beforehand. The count is ``None`` when the call
+        is missing or already closed, in which case nothing is written. The
+        lookup, count and update run in one transaction.
+        """
+
+        with self.transaction(), self._write_connection() as conn:
+            details = self._call_details(conn, call_id)
+            if details is None or details["status"] in _CLOSED_STATUSES:
+                return details, None
+            load = self._count_for_today(conn, engineer_name)
+            self.assign_engineer(call_id, engineer_name)
+        return details, load
 
     def assign_engineer_if_unassigned(self, call_id: int, engineer_name: str) -> bool:
         """Assign an engineer only when the call is still unassigned."""
 
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.execute(
                 """
                 UPDATE calls
                    SET assigned_engineer = ?,
-                       status = ?
+                       status = ?,
+                       updated_at = CURRENT_TIMESTAMP
                  WHERE id = ?
                    AND (assigned_engineer IS NULL OR assigned_engineer = '')
                 """,
                 (engineer_name, "escalated_to_engineer", call_id),
             )
-            conn.commit()
+            self._assignments_changed = True
             return cursor.rowcount > 0
 
     def is_call_assigned(self, call_id: int) -> bool:
-        with self._get_connection() as conn:
+        with self._read_connection() as conn:
             row = conn.execute(
                 "SELECT assigned_engineer FROM calls WHERE id = ?",
                 (call_id,),
@@ -237,121 +543,153 @@ class Database:
             return bool(row and row[0])
 
     def get_call_details(self, call_id: int) -> Dict[str, object] | None:
-        with self._get_connection() as conn:
-            row = conn.execute(
-                """
-                SELECT id,
-                       user_full_name,
-                       department,
-                       issue_type,
-                       employee_code,
-                       issue_description,
-                       ai_guidance,
-                       status,
-                       assigned_engineer
+        with self._read_connection() as conn:
+            return self._call_details(conn, call_id)
+
+    def _call_details(
+        self, conn: sqlite3.Connection, call_id: int
+    ) -> Dict[str, object] | None:
+        row = conn.execute(
+            """
+            SELECT id,
+                   user_full_name,
+                   department,
+                   issue_type,
+                   employee_code,
+                   issue_description,
+                   ai_guidance,
+                   status,
+                   assigned_engineer
+              FROM calls
+             WHERE id = ?
+            """,
+            (call_id,),
+        ).fetchone()
+
+        # ``id`` is an INTEGER PRIMARY KEY, so SQLite already returns an int.
+        return dict(row) if row is not None else None
+
+    # Reporting ------------------------------------------------------------
+    def _today_range(self) -> Tuple[str, str]:
+        """Return today's range, recomputed only once the local date changes."""
+
+        # "Today" is deliberately the local date, as in the original
+        # ``datetime.now().date()`` check and the report ranges, even though
+        # ``created_at`` holds UTC ``CURRENT_TIMESTAMP`` text.
+        now = time.time()
+        cached = self._today
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        today = date.fromtimestamp(now)
+        midnight = datetime.combine(today + timedelta(days=1), dt_time.min)
+        bounds = _day_range(today, today)
+        self._today = (midnight.timestamp(), bounds)
+        return bounds
+
+    def _count_for_today(self, conn: sqlite3.Connection, engineer_name: str) -> int:
+        start, end = self._today_range()
+        cursor = conn.execute(
+            """
+            SELECT COUNT(*)
+            FROM calls
+            WHERE assigned_engineer = ?
+              AND created_at >= ?
+              AND created_at < ?
+            """,
+            (engineer_name, start, end),
+        )
+        result = cursor.fetchone()
+        return int(result[0] if result else 0)
+
+    def engineer_loads(self, engineer_names: Iterable[str]) -> Dict[str, int]:
+        """Return today's call count per engineer using a single query."""
+
+        names = list(engineer_names)
+        if not names:
+            return {}
+
+        bounds = self._today_range()
+        cached = self._loads
+        if (
+            cached is not None
+            and cached[1] == bounds
+            and time.monotonic() - cached[0] < _LOADS_TTL
+            and all(name in cached[2] for name in names)
+        ):
+            return {name: cached[2][name] for name in names}
+
+        generation = self._loads_generation
+        placeholders = ",".join("?" * len(names))
+        start, end = bounds
+        with self._read_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT assigned_engineer, COUNT(*)
                   FROM calls
-                 WHERE id = ?
+                 WHERE assigned_engineer IN ({placeholders})
+                   AND created_at >= ?
+                   AND created_at < ?
+                 GROUP BY assigned_engineer
                 """,
-                (call_id,),
-            ).fetchone()
+                (*names, start, end),
+            ).fetchall()
 
-        if row is None:
-            return None
+        loads = dict.fromkeys(names, 0)
+        loads.update((row[0], int(row[1])) for row in rows)
+        if generation == self._loads_generation:
+            self._loads = (time.monotonic(), bounds, dict(loads))
+        return loads
 
-        return {
-            "id": int(row["id"]),
-            "user_full_name": row["user_full_name"],
-            "department": row["department"],
-            "issue_type": row["issue_type"],
-            "employee_code": row["employee_code"],
-            "issue_description": row["issue_description"],
-            "ai_guidance": row["ai_guidance"],
-            "status": row["status"],
-            "assigned_engineer": row["assigned_engineer"],
-        }
+    def least_loaded_engineer(
+        self, engineer_names: Iterable[str]
+    ) -> Optional[Tuple[str, int]]:
+        """Return the engineer with the fewest calls today and that count.
 
-    # Reporting ------------------------------------------------------------
-    def _count_for_today(self, engineer_name: str) -> int:
-        today = datetime.now().date()
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM calls
-                WHERE assigned_engineer = ?
-                  AND DATE(created_at) = ?
-                """,
-                (engineer_name, today.isoformat()),
-            )
-            result = cursor.fetchone()
-            return int(result[0] if result else 0)
+        Ties go to the engineer listed first.
+        """
 
-    def engineer_loads(self, engineer_names: Iterable[str]) -> Dict[str, int]:
-        return {name: self._count_for_today(name) for name in engineer_names}
+        loads = self.engineer_loads(engineer_names)
+        if not loads:
+            return None
+        name = min(loads, key=loads.__getitem__)
+        return name, loads[name]
 
     def summary(self) -> Dict[str, object]:
-        with self._get_connection() as conn:
-            total_calls = conn.execute("SELECT COUNT(*) FROM calls").fetchone()[0]
-            by_department = conn.execute(
-                "SELECT department, COUNT(*) FROM calls GROUP BY department"
-            ).fetchall()
-            by_issue = conn.execute(
-                "SELECT issue_type, COUNT(*) FROM calls GROUP BY issue_type"
-            ).fetchall()
-            statuses = conn.execute(
-                "SELECT status, COUNT(*) FROM calls GROUP BY status"
+        cached = self._cached_summary(None)
+        if cached is not None:
+            return cached
+
+        # One scan grouped by every reported dimension; the per-dimension
+        # totals are folded together in Python.
+        with self._read_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT department, issue_type, status, COUNT(*)
+                  FROM calls
+                 GROUP BY department, issue_type, status
+                """
             ).fetchall()
 
-        return {
-            "total": int(total_calls),
-            "by_department": [(row[0], int(row[1])) for row in by_department],
-            "by_issue": [(row[0], int(row[1])) for row in by_issue],
-            "statuses": [(row[0], int(row[1])) for row in statuses],
-        }
+        return self._store_summary(None, _summarise(rows))
 
     def summary_between(self, start_date: datetime, end_date: datetime) -> Dict[str, object]:
         """Return summary statistics between inclusive date boundaries."""
 
-        start = start_date.date().isoformat()
-        end = end_date.date().isoformat()
+        start, end = _day_range(start_date.date(), end_date.date())
+        cached = self._cached_summary((start, end))
+        if cached is not None:
+            return cached
 
-        with self._get_connection() as conn:
-            total_calls = conn.execute(
-                "SELECT COUNT(*) FROM calls WHERE DATE(created_at) BETWEEN ? AND ?",
-                (start, end),
-            ).fetchone()[0]
-            by_department = conn.execute(
+        with self._read_connection() as conn:
+            rows = conn.execute(
                 """
-                SELECT department, COUNT(*)
+                SELECT department, issue_type, status, COUNT(*)
                   FROM calls
-                 WHERE DATE(created_at) BETWEEN ? AND ?
-                 GROUP BY department
+                 WHERE created_at >= ? AND created_at < ?
+                 GROUP BY department, issue_type, status
                 """,
                 (start, end),
             ).fetchall()
-            by_issue = conn.execute(
-                """
-                SELECT issue_type, COUNT(*)
-                  FROM calls
-                 WHERE DATE(created_at) BETWEEN ? AND ?
-                 GROUP BY issue_type
-                """,
-                (start, end),
-            ).fetchall()
-            statuses = conn.execute(
-                """
-                SELECT status, COUNT(*)
-                  FROM calls
-                 WHERE DATE(created_at) BETWEEN ? AND ?
-                 GROUP BY status
-                """,
-                (start, end),
-            ).fetchall()
-
-        return {
-            "total": int(total_calls),
-            "by_department": [(row[0], int(row[1])) for row in by_department],
-            "by_issue": [(row[0], int(row[1])) for row in by_issue],
-            "statuses": [(row[0], int(row[1])) for row in statuses],
-        }
 
+        return self._store_summary((start, end), _summarise(rows))
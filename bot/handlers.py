@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import warnings
+import weakref
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, List
 
 from telegram import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
+    Message,
     ReplyKeyboardMarkup,
     ReplyKeyboardRemove,
     Update,
 )
 from telegram.ext import (
     Application,
+    BaseUpdateProcessor,
     CallbackContext,
     CallbackQueryHandler,
     CommandHandler,
@@ -25,20 +31,39 @@ from telegram.ext import (
     MessageHandler,
     filters,
 )
+from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
+from telegram.warnings import PTBUserWarning
 
-from .ai import AIAssistant
 from .config import BotConfig, Engineer
 from .database import Database
 
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from .ai import AIAssistant
+
+try:  # Optional C-accelerated JSON parser.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IssueCategory:
     key: str
     title: str
     basic_guidance: str
+    # Basic guidance and the follow-up question, sent as a single message.
+    followup_prompt: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "followup_prompt",
+            f"{self.basic_guidance}\n\nДээрх алхмууд таны асуудлыг шийдсэн үү?",
+        )
 
 
 ISSUE_CATEGORIES: List[IssueCategory] = [
@@ -90,6 +115,7 @@ ISSUE_CATEGORIES: List[IssueCategory] = [
 ]
 
 ISSUE_BY_TITLE: Dict[str, IssueCategory] = {item.title: item for item in ISSUE_CATEGORIES}
+ISSUE_BY_KEY: Dict[str, IssueCategory] = {item.key: item for item in ISSUE_CATEGORIES}
 
 
 class ConversationState(Enum):
@@ -104,60 +130,245 @@ YES_NO_KEYBOARD = ReplyKeyboardMarkup(
     [["Тийм", "Үгүй"]], resize_keyboard=True, one_time_keyboard=True
 )
 
-ISSUE_KEYBOARD = ReplyKeyboardMarkup(
+REMOVE_KEYBOARD = ReplyKeyboardRemove()
+
+# Issue buttons laid out two per row. They carry the short ASCII category key
+# as callback data, so a tap is matched without comparing the Mongolian title.
+ISSUE_ROWS = tuple(
+    tuple(
+        InlineKeyboardButton(item.title, callback_data=f"issue:{item.key}")
+        for item in ISSUE_CATEGORIES[i : i + 2]
+    )
+    for i in range(0, len(ISSUE_CATEGORIES), 2)
+)
+
+ISSUE_KEYBOARD = InlineKeyboardMarkup(ISSUE_ROWS)
+
+REPORT_KEYBOARD = InlineKeyboardMarkup(
     [
-        [item.title for item in ISSUE_CATEGORIES[i : i + 2]]
-        for i in range(0, len(ISSUE_CATEGORIES), 2)
-    ],
-    resize_keyboard=True,
+        [
+            InlineKeyboardButton("Өнөөдөр", callback_data="report:today"),
+            InlineKeyboardButton("Сүүлийн 7 хоног", callback_data="report:7d"),
+        ],
+        [
+            InlineKeyboardButton("Энэ сар", callback_data="report:month"),
+            InlineKeyboardButton("Өнгөрсөн сар", callback_data="report:prev_month"),
+        ],
+        [InlineKeyboardButton("Хугацаа сонгох", callback_data="report:custom")],
+    ]
+)
+
+# Minimum delay between edits of a streamed AI reply; Telegram throttles
+# frequent edits of the same message.
+STREAM_EDIT_INTERVAL = 1.0
+
+# Message bodies are filled with ``str.format_map`` so each notification is
+# built in one step.
+_CALL_FIELDS_TEMPLATE = (
+    "- Дуудлагын ID: {call_id}\n"
+    "- Ажилтан: {full_name}\n"
+    "- Бүтцийн нэгж: {department}\n"
+    "- Ажилтны код: {employee_code}\n"
+    "- Асуудлын төрөл: {issue_type}\n"
+    "- Дэлгэрэнгүй: {issue_description}"
+)
+_NO_ENGINEERS_TEMPLATE = (
+    "Инженерийн жагсаалт тохируулагдаагүй тул дуудлага автоматаар оноогдсонгүй.\n"
+    + _CALL_FIELDS_TEMPLATE
+)
+_ESCALATION_TEMPLATE = (
+    "Дуудлагыг инженерт оноох шаардлагатай байна.\n" + _CALL_FIELDS_TEMPLATE + "\n"
+)
+_ESCALATION_AI_TEMPLATE = "\n- AI зөвлөгөө:\n{ai_guidance}\n"
+_ESCALATION_FOOTER = (
+    "\n10 минутын дотор /assign_call ДУУДЛАГЫН_ID ИНЖЕНЕР_НЭР командыг ашиглан инженер онооно уу."
+    " Хэрэв оноохгүй бол систем хамгийн бага ачаалалтай инженерт автоматаар онооно."
+)
+_AI_FAILURE_TEMPLATE = (
+    "AI зөвлөгөө авах үеэр алдаа гарлаа.\n"
+    "- Дуудлагын ID: {call_id}\n"
+    "- Ажилтны код: {employee_code}\n"
+    "- Ажилтан: {full_name}\n"
+    "- Бүтцийн нэгж: {department}\n"
 )
+_ASSIGNMENT_TEMPLATE = (
+    "Шинэ дуудлага:\n"
+    "- Дуудлагын ID: {id}\n"
+    "- Ажилтан: {user_full_name}\n"
+    "- Бүтцийн нэгж: {department}\n"
+    "- Ажилтны код: {employee_code}\n"
+    "- Асуудлын төрөл: {issue_type}\n"
+    "- Дэлгэрэнгүй: {issue_description}\n"
+    "- Оноосон инженер: {engineer}\n"
+    "- Өнөөдрийн ачаалал: {load} дуудлага"
+)
+_ASSIGNMENT_AI_TEMPLATE = "\n- AI зөвлөгөө:\n{ai_guidance}"
+
+# (summary key, heading) for each breakdown in the report message.
+_SUMMARY_SECTIONS = (
+    ("by_department", "\nБүтцийн нэгжээр:"),
+    ("by_issue", "\nАсуудлын төрлөөр:"),
+    ("statuses", "\nСтатус:"),
+)
+
+# Plain text that is not a command; shared by every conversation state.
+TEXT_MESSAGE = filters.TEXT & ~filters.COMMAND
+
+YES_RESPONSES = frozenset({"тийм", "tiim", "yes", "y"})
+NO_RESPONSES = frozenset({"үгүй", "ugui", "no", "n"})
+# Normalised yes/no reply -> True for "yes"; one lookup classifies an answer.
+FOLLOWUP_ANSWERS: Dict[str, bool] = {
+    **dict.fromkeys(YES_RESPONSES, True),
+    **dict.fromkeys(NO_RESPONSES, False),
+}
+
+
+def classify_answer(text: str) -> bool | None:
+    """Return ``True``/``False`` for a yes/no reply, ``None`` if it is neither."""
+
+    return FOLLOWUP_ANSWERS.get(text.strip().casefold())
+
+
+@dataclass(slots=True)
+class ConversationData:
+    """One user's progress through the support conversation."""
+
+    employee_code_attempts: int = 0
+    employee_code: str | None = None
+    full_name: str | None = None
+    department: str | None = None
+    issue_category: IssueCategory | None = None
+    call_id: int | None = None
+    issue_description: str | None = None
+    ai_guidance: str | None = None
+
+
+# ``user_data`` key holding the ConversationData; handlers read attributes on
+# it instead of looking up several string keys per message.
+CONVERSATION_KEY = "conversation"
+
+
+def conversation_data(context: CallbackContext) -> ConversationData:
+    """Return the user's conversation data, creating it if missing."""
+
+    data = context.user_data.get(CONVERSATION_KEY)
+    if data is None:
+        data = context.user_data[CONVERSATION_KEY] = ConversationData()
+    return data
+
+
+def log_failures(results: List[Any], *labels: str) -> None:
+    """Log each exception returned by ``gather(..., return_exceptions=True)``."""
+
+    for label, result in zip(labels, results):
+        if isinstance(result, BaseException):
+            logger.error("%s failed", label, exc_info=result)
+
+
+# Upper bound on updates processed at once across all chats.
+MAX_CONCURRENT_UPDATES = 256
+
 
-YES_RESPONSES = {"тийм", "tiim", "yes", "y"}
-NO_RESPONSES = {"үгүй", "ugui", "no", "n"}
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    """Process updates concurrently across chats but one at a time per chat.
+
+    ``ConversationHandler`` needs a chat's updates handled in order; a lock per
+    chat keeps that guarantee while a slow conversation (e.g. waiting on the
+    AI) no longer holds up every other user.
+    """
+
+    __slots__ = ("_chat_locks",)
+
+    def __init__(self, max_concurrent_updates: int) -> None:
+        super().__init__(max_concurrent_updates)
+        # Locks disappear once no update of that chat is pending.
+        self._chat_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            await coroutine
+            return
+
+        lock = self._chat_locks.get(chat.id)
+        if lock is None:
+            lock = self._chat_locks[chat.id] = asyncio.Lock()
+        async with lock:
+            await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
+class TelegramRequest(HTTPXRequest):
+    """Bot API transport that parses responses with orjson when it is installed."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> Dict[str, Any]:
+        try:
+            return _json_loads(payload)
+        except ValueError:
+            # PTB's parser decodes leniently, logs the payload and raises
+            # TelegramError, so malformed responses fail the usual way.
+            return HTTPXRequest.parse_json_payload(payload)
 
 
 class BotHandler:
+    __slots__ = (
+        "_config",
+        "_database",
+        "_ai",
+        "_manager_chat_id",
+        "_engineer_names",
+        "_engineer_names_text",
+        "_engineers_by_name",
+    )
+
     def __init__(self, config: BotConfig, database: Database, ai: AIAssistant) -> None:
         self._config = config
         self._database = database
         self._ai = ai
-        self._report_keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton("Өнөөдөр", callback_data="report:today"),
-                    InlineKeyboardButton("Сүүлийн 7 хоног", callback_data="report:7d"),
-                ],
-                [
-                    InlineKeyboardButton("Энэ сар", callback_data="report:month"),
-                    InlineKeyboardButton("Өнгөрсөн сар", callback_data="report:prev_month"),
-                ],
-                [InlineKeyboardButton("Хугацаа сонгох", callback_data="report:custom")],
-            ]
-        )
+        self._manager_chat_id = config.manager_chat_id
+        # Engineers are fixed for the life of the process, so the derived
+        # lookups are built once here.
+        self._engineer_names = tuple(engineer.name for engineer in config.engineers)
+        self._engineer_names_text = ", ".join(self._engineer_names) or "тодорхойгүй"
+        # Built in reverse so the first engineer wins if two names collide.
+        self._engineers_by_name = {
+            engineer.name.lower(): engineer for engineer in reversed(config.engineers)
+        }
 
     # Conversation flow --------------------------------------------------
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> ConversationState:
-        context.user_data.clear()
+        user_data = context.user_data
+        user_data.clear()
+        user_data[CONVERSATION_KEY] = ConversationData()
         await update.message.reply_text(
             "Сайн байна уу. Та өөрийн ажилтны кодоо оруулна уу.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
-        context.user_data["employee_code_attempts"] = 0
         return ConversationState.ASK_EMPLOYEE_CODE
 
     async def receive_employee_code(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> ConversationState:
         code = update.message.text.strip()
-        attempts = int(context.user_data.get("employee_code_attempts", 0)) + 1
-        context.user_data["employee_code_attempts"] = attempts
+        data = conversation_data(context)
+        data.employee_code_attempts += 1
 
-        employee = self._database.get_employee(code)
+        employee = await asyncio.to_thread(self._database.get_employee, code)
         if employee and employee.get("full_name") and employee.get("department"):
-            context.user_data["employee_code"] = code
-            context.user_data["full_name"] = employee["full_name"]
-            context.user_data["department"] = employee["department"]
-            context.user_data.pop("employee_code_attempts", None)
+            data.employee_code = code
+            data.full_name = employee["full_name"]
+            data.department = employee["department"]
+            data.employee_code_attempts = 0
             await update.message.reply_text(
                 (
                     f"Сайн байна уу, {employee['full_name']}!\n"
@@ -168,70 +379,105 @@ class BotHandler:
             )
             return ConversationState.CHOOSE_ISSUE
 
-        if attempts >= 3:
+        if data.employee_code_attempts >= 3:
             await update.message.reply_text(
                 "Алдаатай код 3 удаа орууллаа. Дахин оролдохын тулд /start командыг ашиглана уу.",
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=REMOVE_KEYBOARD,
             )
             return ConversationHandler.END
 
         await update.message.reply_text(
             "Ажилтны код буруу байна. Менежертэй холбогдож кодоо шалгаад дахин оруулна уу.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
         return ConversationState.ASK_EMPLOYEE_CODE
 
+    async def choose_issue_button(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> ConversationState | int:
+        query = update.callback_query
+        await query.answer()
+        category = ISSUE_BY_KEY.get(query.data.partition(":")[2])
+        if not category:
+            await query.message.reply_text(
+                "Жагсаалтаас сонголтоо хийнэ үү.", reply_markup=ISSUE_KEYBOARD
+            )
+            return ConversationState.CHOOSE_ISSUE
+        return await self._open_call(update, context, query.message, category)
+
+    async def expired_issue_button(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        # Taps on an issue keyboard from a finished conversation still need an
+        # answer, otherwise the client keeps showing its loading spinner.
+        await update.callback_query.answer(
+            "Энэ цэс хүчингүй болсон. /start командыг ашиглан дахин эхлүүлнэ үү."
+        )
+
     async def choose_issue(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ) -> ConversationState:
-        text = update.message.text.strip()
-        category = ISSUE_BY_TITLE.get(text)
+    ) -> ConversationState | int:
+        # Typed titles are still accepted alongside the inline buttons.
+        category = ISSUE_BY_TITLE.get(update.message.text.strip())
         if not category:
             await update.message.reply_text(
                 "Жагсаалтаас сонголтоо хийнэ үү.", reply_markup=ISSUE_KEYBOARD
             )
             return ConversationState.CHOOSE_ISSUE
+        return await self._open_call(update, context, update.message, category)
 
-        if "full_name" not in context.user_data or "department" not in context.user_data:
-            await update.message.reply_text(
+    async def _open_call(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        message: Message,
+        category: IssueCategory,
+    ) -> ConversationState | int:
+        """Register a call for ``category`` and send its basic guidance."""
+
+        data = conversation_data(context)
+        if data.full_name is None or data.department is None:
+            await message.reply_text(
                 "Ажилтны мэдээлэл олдсонгүй. /start командыг ашиглан дахин эхлүүлнэ үү.",
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=REMOVE_KEYBOARD,
             )
             return ConversationHandler.END
 
-        context.user_data["issue_category"] = category
+        data.issue_category = category
         user = update.effective_user
-        call_id = self._database.create_call(
+        data.call_id = await asyncio.to_thread(
+            self._database.create_call,
             telegram_user_id=user.id,
-            full_name=context.user_data["full_name"],
-            department=context.user_data["department"],
+            full_name=data.full_name,
+            department=data.department,
             issue_type=category.title,
-            employee_code=context.user_data.get("employee_code"),
+            employee_code=data.employee_code,
             basic_guidance=category.basic_guidance,
         )
-        context.user_data["call_id"] = call_id
 
-        await update.message.reply_text(category.basic_guidance, reply_markup=YES_NO_KEYBOARD)
-        await update.message.reply_text(
-            "Дээрх алхмууд таны асуудлыг шийдсэн үү?", reply_markup=YES_NO_KEYBOARD
+        await message.reply_text(
+            category.followup_prompt,
+            reply_markup=YES_NO_KEYBOARD,
         )
         return ConversationState.BASIC_FOLLOWUP
 
     async def handle_basic_followup(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> ConversationState | int:
-        response = update.message.text.strip().lower()
-        if response in YES_RESPONSES:
-            self._database.mark_status(
-                context.user_data["call_id"], "resolved_with_basic"
+        answer = classify_answer(update.message.text)
+        if answer:
+            await asyncio.to_thread(
+                self._database.mark_status,
+                conversation_data(context).call_id,
+                "resolved_with_basic",
             )
             await update.message.reply_text(
                 "Баярлалаа. Дуудлага амжилттай хаагдлаа.",
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=REMOVE_KEYBOARD,
             )
             return ConversationHandler.END
 
-        if response not in NO_RESPONSES:
+        if answer is None:
             await update.message.reply_text(
                 "Хариултаа 'Тийм' эсвэл 'Үгүй' гэж оруулна уу.",
                 reply_markup=YES_NO_KEYBOARD,
@@ -240,61 +486,129 @@ class BotHandler:
 
         await update.message.reply_text(
             "Тулгарсан асуудлаа дэлгэрэнгүй тайлбарлана уу.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
         return ConversationState.REQUEST_DETAILS
 
     async def request_details(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ) -> ConversationState:
+    ) -> ConversationState | int:
         description = update.message.text.strip()
-        call_id = context.user_data["call_id"]
-        context.user_data["issue_description"] = description
-        self._database.update_issue_description(call_id, description)
-        self._database.mark_status(call_id, "awaiting_ai_guidance")
-        await update.message.reply_text("Хиймэл оюун ухаанаас зөвлөгөө авч байна...")
+        data = conversation_data(context)
+        call_id = data.call_id
+        data.issue_description = description
+        await asyncio.to_thread(
+            self._database.record_issue_description,
+            call_id,
+            description,
+            "awaiting_ai_guidance",
+        )
+        progress = await update.message.reply_text(
+            "Хүсэлт олон байгаа тул дараалалд орлоо. Түр хүлээнэ үү..."
+            if self._ai.busy
+            else "Хиймэл оюун ухаанаас зөвлөгөө авч байна..."
+        )
 
-        category: IssueCategory = context.user_data["issue_category"]
+        category = data.issue_category
         try:
-            guidance = await context.application.run_in_executor(
-                None,
-                self._ai.generate_guidance,
-                category.title,
-                description,
+            # A stalled model must not hold the conversation open; a timeout
+            # takes the same fallback as any other AI failure.
+            guidance = await asyncio.wait_for(
+                self._stream_guidance(progress, category.title, description),
+                timeout=self._config.openai_timeout,
             )
         except Exception as exc:  # pragma: no cover - runtime safeguard
             logger.exception("AI guidance generation failed")
-            self._database.mark_status(call_id, "ai_guidance_failed")
-            await update.message.reply_text(
-                "Хиймэл оюуны зөвлөгөө авахад алдаа гарлаа. Менежерт мэдэгдлээ.",
-                reply_markup=ReplyKeyboardRemove(),
-            )
-            await self._notify_manager_ai_failure(context, call_id, exc)
-            await self._escalate(update, context, call_id)
-            return ConversationHandler.END
-        self._database.update_ai_guidance(call_id, guidance)
-        context.user_data["ai_guidance"] = guidance
+            return await self._ai_guidance_failed(update, context, call_id, exc)
+        await asyncio.to_thread(self._database.update_ai_guidance, call_id, guidance)
+        data.ai_guidance = guidance
 
-        await update.message.reply_text(guidance, reply_markup=YES_NO_KEYBOARD)
         await update.message.reply_text(
             "Эдгээр алхам тань тус болсон уу?", reply_markup=YES_NO_KEYBOARD
         )
         return ConversationState.AI_FOLLOWUP
 
+    async def _ai_guidance_failed(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        call_id: int,
+        exc: Exception,
+    ) -> int:
+        """Tell the user and manager that AI guidance failed, then escalate."""
+
+        await asyncio.to_thread(self._database.mark_status, call_id, "ai_guidance_failed")
+        await update.message.reply_text(
+            "Хиймэл оюуны зөвлөгөө авахад алдаа гарлаа. Менежерт мэдэгдлээ.",
+            reply_markup=REMOVE_KEYBOARD,
+        )
+        # Both only read the conversation data, so they can run side by side.
+        # Neither failure may leave the other unsupervised or the conversation
+        # stuck, so errors are collected and logged.
+        results = await asyncio.gather(
+            self._notify_manager_ai_failure(context, call_id, exc),
+            self._escalate(update, context, call_id),
+            return_exceptions=True,
+        )
+        log_failures(results, "AI failure notice", "Escalation")
+        return ConversationHandler.END
+
+    async def _stream_guidance(
+        self, message: Message, issue_type: str, description: str
+    ) -> str:
+        """Stream AI guidance into ``message``, editing it as text arrives."""
+
+        loop = asyncio.get_running_loop()
+        parts: List[str] = []
+        shown = ""
+        last_edit = loop.time()
+        stream = self._ai.stream_guidance(issue_type, description)
+        try:
+            async for delta in stream:
+                parts.append(delta)
+                if loop.time() - last_edit < STREAM_EDIT_INTERVAL:
+                    continue
+                text = "".join(parts).strip()
+                if text and text != shown:
+                    # Progress edits are best-effort (flood limits, transient
+                    # errors); only the final text has to reach the user.
+                    try:
+                        await message.edit_text(text)
+                    except TelegramError:
+                        logger.debug("Skipped a streamed guidance edit", exc_info=True)
+                    else:
+                        shown = text
+                last_edit = loop.time()
+        finally:
+            # Release the API response promptly on timeout or cancellation.
+            await stream.aclose()
+
+        guidance = "".join(parts).strip()
+        if guidance and guidance != shown:
+            try:
+                await message.edit_text(guidance)
+            except TelegramError:
+                logger.warning(
+                    "Could not edit the guidance message, sending it anew",
+                    exc_info=True,
+                )
+                await message.reply_text(guidance, quote=False)
+        return guidance
+
     async def handle_ai_followup(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> ConversationState | int:
-        response = update.message.text.strip().lower()
-        call_id = context.user_data["call_id"]
-        if response in YES_RESPONSES:
-            self._database.mark_status(call_id, "resolved_with_ai")
+        answer = classify_answer(update.message.text)
+        call_id = conversation_data(context).call_id
+        if answer:
+            await asyncio.to_thread(self._database.mark_status, call_id, "resolved_with_ai")
             await update.message.reply_text(
                 "Сайн байна. Дуудлага хиймэл оюуны зөвлөгөөгөөр хаагдлаа.",
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=REMOVE_KEYBOARD,
             )
             return ConversationHandler.END
 
-        if response not in NO_RESPONSES:
+        if answer is None:
             await update.message.reply_text(
                 "Хариултаа 'Тийм' эсвэл 'Үгүй' гэж оруулна уу.",
                 reply_markup=YES_NO_KEYBOARD,
@@ -307,59 +621,46 @@ class BotHandler:
     async def _escalate(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, call_id: int
     ) -> None:
+        data = conversation_data(context)
+        fields = {
+            "call_id": call_id,
+            "full_name": data.full_name,
+            "department": data.department,
+            "employee_code": data.employee_code or "бүртгэгдээгүй",
+            "issue_type": data.issue_category.title,
+            "issue_description": data.issue_description or "бүртгэгдээгүй",
+            "ai_guidance": data.ai_guidance,
+        }
+        await asyncio.to_thread(self._database.mark_status, call_id, "awaiting_manager")
+
         engineers = self._config.engineers
         if not engineers:
-            await update.message.reply_text(
-                "Одоогоор инженерийн мэдээлэл бүртгэгдээгүй байна. Менежерт мэдэгдэнэ.",
-                reply_markup=ReplyKeyboardRemove(),
-            )
-            self._database.mark_status(call_id, "awaiting_manager")
-            category: IssueCategory = context.user_data["issue_category"]
-            await context.bot.send_message(
-                chat_id=self._config.manager_chat_id,
-                text=(
-                    "Инженерийн жагсаалт тохируулагдаагүй тул дуудлага автоматаар оноогдсонгүй.\n"
-                    f"- Дуудлагын ID: {call_id}\n"
-                    f"- Ажилтан: {context.user_data['full_name']}\n"
-                    f"- Бүтцийн нэгж: {context.user_data['department']}\n"
-                    f"- Ажилтны код: {context.user_data.get('employee_code', 'бүртгэгдээгүй')}\n"
-                    f"- Асуудлын төрөл: {category.title}\n"
-                    f"- Дэлгэрэнгүй: {context.user_data.get('issue_description', 'бүртгэгдээгүй')}"
+            # The user reply and the manager notice are independent requests;
+            # one failing must not cancel the other.
+            results = await asyncio.gather(
+                update.message.reply_text(
+                    "Одоогоор инженерийн мэдээлэл бүртгэгдээгүй байна. Менежерт мэдэгдэнэ.",
+                    reply_markup=REMOVE_KEYBOARD,
                 ),
+                context.bot.send_message(
+                    chat_id=self._manager_chat_id,
+                    text=_NO_ENGINEERS_TEMPLATE.format_map(fields),
+                ),
+                return_exceptions=True,
             )
+            log_failures(results, "User escalation reply", "Manager escalation notice")
             return
-        loads = self._database.engineer_loads([engineer.name for engineer in engineers])
-        self._database.mark_status(call_id, "awaiting_manager")
-
-        category: IssueCategory = context.user_data["issue_category"]
-        summary_lines = [
-            "Дуудлагыг инженерт оноох шаардлагатай байна.\n",
-            f"- Дуудлагын ID: {call_id}\n",
-            f"- Ажилтан: {context.user_data['full_name']}\n",
-            f"- Бүтцийн нэгж: {context.user_data['department']}\n",
-            f"- Ажилтны код: {context.user_data.get('employee_code', 'бүртгэгдээгүй')}\n",
-            f"- Асуудлын төрөл: {category.title}\n",
-            f"- Дэлгэрэнгүй: {context.user_data.get('issue_description', 'бүртгэгдээгүй')}\n",
-        ]
-        ai_guidance = context.user_data.get("ai_guidance")
-        if ai_guidance:
-            summary_lines.append("\n- AI зөвлөгөө:\n" + ai_guidance + "\n")
-
-        summary_lines.append("\nБоломжит инженерүүд:\n")
-        for engineer in engineers:
-            summary_lines.append(
-                f"- {engineer.name}: {loads.get(engineer.name, 0)} дуудлага өнөөдөр\n"
-            )
-
-        summary_lines.append(
-            "\n10 минутын дотор /assign_call ДУУДЛАГЫН_ID ИНЖЕНЕР_НЭР командыг ашиглан инженер онооно уу."
-            " Хэрэв оноохгүй бол систем хамгийн бага ачаалалтай инженерт автоматаар онооно."
-        )
-
-        await context.bot.send_message(
-            chat_id=self._config.manager_chat_id,
-            text="".join(summary_lines),
+        loads = await asyncio.to_thread(self._database.engineer_loads, self._engineer_names)
+
+        summary_parts = [_ESCALATION_TEMPLATE.format_map(fields)]
+        if fields["ai_guidance"]:
+            summary_parts.append(_ESCALATION_AI_TEMPLATE.format_map(fields))
+        summary_parts.append("\nБоломжит инженерүүд:\n")
+        summary_parts.extend(
+            f"- {engineer.name}: {loads.get(engineer.name, 0)} дуудлага өнөөдөр\n"
+            for engineer in engineers
         )
+        summary_parts.append(_ESCALATION_FOOTER)
 
         job_queue = context.application.job_queue if context.application else None
         if job_queue:
@@ -370,10 +671,18 @@ class BotHandler:
                 data={"call_id": call_id},
             )
 
-        await update.message.reply_text(
-            "Манай менежер дуудлагыг шалгаж, инженерт оноож байна. Удахгүй холбогдоно.",
-            reply_markup=ReplyKeyboardRemove(),
+        results = await asyncio.gather(
+            context.bot.send_message(
+                chat_id=self._manager_chat_id,
+                text="".join(summary_parts),
+            ),
+            update.message.reply_text(
+                "Манай менежер дуудлагыг шалгаж, инженерт оноож байна. Удахгүй холбогдоно.",
+                reply_markup=REMOVE_KEYBOARD,
+            ),
+            return_exceptions=True,
         )
+        log_failures(results, "Manager escalation notice", "User escalation reply")
 
     async def _notify_manager_ai_failure(
         self,
@@ -381,31 +690,24 @@ class BotHandler:
         call_id: int,
         exc: Exception,
     ) -> None:
-        message_lines = [
-            "AI зөвлөгөө авах үеэр алдаа гарлаа.\n",
-            f"- Дуудлагын ID: {call_id}\n",
-            f"- Ажилтны код: {context.user_data.get('employee_code', 'бүртгэгдээгүй')}\n",
-            f"- Ажилтан: {context.user_data.get('full_name', 'тодорхойгүй')}\n",
-            f"- Бүтцийн нэгж: {context.user_data.get('department', 'тодорхойгүй')}\n",
-        ]
+        data = conversation_data(context)
+        text = _AI_FAILURE_TEMPLATE.format(
+            call_id=call_id,
+            employee_code=data.employee_code or "бүртгэгдээгүй",
+            full_name=data.full_name or "тодорхойгүй",
+            department=data.department or "тодорхойгүй",
+        )
         details = str(exc)
         if details:
-            message_lines.append(f"- Алдааны мэдээлэл: {details}\n")
+            text += f"- Алдааны мэдээлэл: {details}\n"
 
-        await context.bot.send_message(
-            chat_id=self._config.manager_chat_id,
-            text="".join(message_lines),
-        )
+        await context.bot.send_message(chat_id=self._manager_chat_id, text=text)
 
     def _auto_assign_job_name(self, call_id: int) -> str:
         return f"auto_assign_{call_id}"
 
     def _find_engineer(self, name: str) -> Engineer | None:
-        lookup = name.strip().lower()
-        for engineer in self._config.engineers:
-            if engineer.name.lower() == lookup:
-                return engineer
-        return None
+        return self._engineers_by_name.get(name.strip().lower())
 
     def _compose_assignment_summary(
         self,
@@ -413,21 +715,17 @@ class BotHandler:
         engineer: Engineer,
         loads: Dict[str, int],
     ) -> str:
-        summary_lines = [
-            "Шинэ дуудлага:\n",
-            f"- Дуудлагын ID: {details['id']}\n",
-            f"- Ажилтан: {details['user_full_name']}\n",
-            f"- Бүтцийн нэгж: {details['department']}\n",
-            f"- Ажилтны код: {details.get('employee_code') or 'бүртгэгдээгүй'}\n",
-            f"- Асуудлын төрөл: {details['issue_type']}\n",
-            f"- Дэлгэрэнгүй: {details.get('issue_description') or 'бүртгэгдээгүй'}\n",
-            f"- Оноосон инженер: {engineer.name}\n",
-            f"- Өнөөдрийн ачаалал: {loads.get(engineer.name, 0) + 1} дуудлага",
-        ]
-        ai_guidance = details.get("ai_guidance")
-        if ai_guidance:
-            summary_lines.append("\n- AI зөвлөгөө:\n" + str(ai_guidance))
-        return "".join(summary_lines)
+        fields = {
+            **details,
+            "employee_code": details.get("employee_code") or "бүртгэгдээгүй",
+            "issue_description": details.get("issue_description") or "бүртгэгдээгүй",
+            "engineer": engineer.name,
+            "load": loads.get(engineer.name, 0) + 1,
+        }
+        summary = _ASSIGNMENT_TEMPLATE.format_map(fields)
+        if details.get("ai_guidance"):
+            summary += _ASSIGNMENT_AI_TEMPLATE.format_map(fields)
+        return summary
 
     async def _notify_engineer(
         self, context: CallbackContext, engineer: Engineer, summary: str
@@ -441,7 +739,12 @@ class BotHandler:
                 ),
             )
         except Exception:  # pragma: no cover - engineer chat might be invalid
-            pass
+            logger.warning(
+                "Could not notify engineer %s (chat %s)",
+                engineer.name,
+                engineer.chat_id,
+                exc_info=True,
+            )
 
     async def _auto_assign_job(self, context: CallbackContext) -> None:
         job = context.job
@@ -449,39 +752,47 @@ class BotHandler:
         if call_id is None:
             return
 
-        engineers = self._config.engineers
-        if not engineers:
+        if not self._engineer_names:
             return
 
-        if self._database.is_call_assigned(call_id):
+        if await asyncio.to_thread(self._database.is_call_assigned, call_id):
             return
 
-        loads = self._database.engineer_loads([engineer.name for engineer in engineers])
-        selected = min(engineers, key=lambda eng: loads.get(eng.name, 0))
-        assigned = self._database.assign_engineer_if_unassigned(call_id, selected.name)
+        least_loaded = await asyncio.to_thread(
+            self._database.least_loaded_engineer, self._engineer_names
+        )
+        if least_loaded is None:
+            return
+        name, load = least_loaded
+        selected = self._find_engineer(name)
+        if selected is None:
+            return
+        assigned = await asyncio.to_thread(
+            self._database.assign_engineer_if_unassigned, call_id, selected.name
+        )
         if not assigned:
             return
 
-        details = self._database.get_call_details(call_id)
+        details = await asyncio.to_thread(self._database.get_call_details, call_id)
         if not details:
             return
 
-        summary = self._compose_assignment_summary(details, selected, loads)
+        summary = self._compose_assignment_summary(details, selected, {name: load})
+        context.application.create_task(self._notify_engineer(context, selected, summary))
         await context.bot.send_message(
-            chat_id=self._config.manager_chat_id,
+            chat_id=self._manager_chat_id,
             text="10 минут өнгөрсөн тул дуудлагыг автоматаар оноолоо.\n\n" + summary,
         )
-        await self._notify_engineer(context, selected, summary)
 
     # Reporting ----------------------------------------------------------
     async def report(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         user_id = update.effective_user.id
-        if user_id != self._config.manager_chat_id:
+        if user_id != self._manager_chat_id:
             await update.message.reply_text("Энэ коммандыг ашиглах эрхгүй байна.")
             return
 
         await update.message.reply_text(
-            "Тайлан авах хугацаагаа сонгоно уу.", reply_markup=self._report_keyboard
+            "Тайлан авах хугацаагаа сонгоно уу.", reply_markup=REPORT_KEYBOARD
         )
 
     async def handle_report_callback(
@@ -490,7 +801,7 @@ class BotHandler:
         query = update.callback_query
         await query.answer()
 
-        if query.from_user.id != self._config.manager_chat_id:
+        if query.from_user.id != self._manager_chat_id:
             await query.edit_message_text("Энэ үйлдлийг зөвхөн менежер ашиглана.")
             return
 
@@ -516,7 +827,7 @@ class BotHandler:
                     "Хугацаагаа YYYY-MM-DD - YYYY-MM-DD форматтайгаар оруулна уу.\n"
                     "Жишээ: 2024-05-01 - 2024-05-31"
                 ),
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=REMOVE_KEYBOARD,
             )
             return
         else:
@@ -531,7 +842,7 @@ class BotHandler:
         if not context.user_data.get("awaiting_report_range"):
             return
 
-        if update.effective_user.id != self._config.manager_chat_id:
+        if update.effective_user.id != self._manager_chat_id:
             return
 
         text = update.message.text
@@ -540,7 +851,7 @@ class BotHandler:
         except ValueError:
             await update.message.reply_text(
                 "Огнооны форматыг YYYY-MM-DD - YYYY-MM-DD байдлаар оруулна уу.",
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=REMOVE_KEYBOARD,
             )
             return
 
@@ -553,6 +864,8 @@ class BotHandler:
         if len(parts) != 2:
             raise ValueError("invalid format")
 
+        # ``strptime`` rejects times and UTC offsets, so both ends are naive
+        # midnights and always comparable.
         start = datetime.strptime(parts[0], "%Y-%m-%d")
         end = datetime.strptime(parts[1], "%Y-%m-%d")
         if start > end:
@@ -566,21 +879,11 @@ class BotHandler:
             f"Тайлангийн хугацаа: {start.date()} - {end.date()}",
             f"Нийт хүлээн авсан дуудлага: {summary['total']}",
         ]
-
-        if summary["by_department"]:
-            lines.append("\nБүтцийн нэгжээр:")
-            for department, count in summary["by_department"]:
-                lines.append(f"- {department}: {count}")
-
-        if summary["by_issue"]:
-            lines.append("\nАсуудлын төрлөөр:")
-            for issue, count in summary["by_issue"]:
-                lines.append(f"- {issue}: {count}")
-
-        if summary["statuses"]:
-            lines.append("\nСтатус:")
-            for status, count in summary["statuses"]:
-                lines.append(f"- {status}: {count}")
+        for key, heading in _SUMMARY_SECTIONS:
+            rows = summary[key]
+            if rows:
+                lines.append(heading)
+                lines.extend(f"- {name}: {count}" for name, count in rows)
 
         return "\n".join(lines)
 
@@ -591,18 +894,18 @@ class BotHandler:
         start: datetime,
         end: datetime,
     ) -> None:
-        summary = self._database.summary_between(start, end)
+        summary = await asyncio.to_thread(self._database.summary_between, start, end)
         await context.bot.send_message(
             chat_id=chat_id,
             text=self._format_summary(summary, start, end),
-            reply_markup=self._report_keyboard,
+            reply_markup=REPORT_KEYBOARD,
         )
 
     async def add_employee(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         user_id = update.effective_user.id
-        if user_id != self._config.manager_chat_id:
+        if user_id != self._manager_chat_id:
             await update.message.reply_text("Энэ коммандыг ашиглах эрхгүй байна.")
             return
 
@@ -628,7 +931,9 @@ class BotHandler:
             )
             return
 
-        created = self._database.add_employee(code, full_name, department)
+        created = await asyncio.to_thread(
+            self._database.add_employee, code, full_name, department
+        )
         if created:
             await update.message.reply_text(
                 f"{code} код бүхий {full_name} амжилттай нэмэгдлээ."
@@ -640,7 +945,7 @@ class BotHandler:
 
     async def assign_call(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         user_id = update.effective_user.id
-        if user_id != self._config.manager_chat_id:
+        if user_id != self._manager_chat_id:
             await update.message.reply_text("Энэ коммандыг ашиглах эрхгүй байна.")
             return
 
@@ -663,46 +968,50 @@ class BotHandler:
 
         engineer = self._find_engineer(engineer_name)
         if not engineer:
-            available = ", ".join(eng.name for eng in self._config.engineers) or "тодорхойгүй"
+            available = self._engineer_names_text
             await update.message.reply_text(
                 f"{engineer_name} нэртэй инженер тохируулагдаагүй байна. Боломжит нэрс: {available}"
             )
             return
 
-        details = self._database.get_call_details(call_id)
+        details, load = await asyncio.to_thread(
+            self._database.assign_open_call, call_id, engineer.name
+        )
         if not details:
             await update.message.reply_text(
                 f"{call_id} дуудлага олдсонгүй."
             )
             return
 
-        if details["status"] in {"resolved_with_basic", "resolved_with_ai"}:
+        if load is None:
             await update.message.reply_text(
                 "Энэ дуудлага аль хэдийн хаагдсан байна."
             )
             return
 
+        # The pending auto-assignment is superseded only once the manager's
+        # assignment has gone through; if it fires first, it finds the call
+        # already assigned and does nothing.
         job_queue = context.application.job_queue if context.application else None
         if job_queue:
             for job in job_queue.get_jobs_by_name(self._auto_assign_job_name(call_id)):
                 job.schedule_removal()
 
-        loads = self._database.engineer_loads([eng.name for eng in self._config.engineers])
-        self._database.assign_engineer(call_id, engineer.name)
-
-        summary = self._compose_assignment_summary(details, engineer, loads)
+        summary = self._compose_assignment_summary(
+            details, engineer, {engineer.name: load}
+        )
+        # The engineer DM is best-effort, so the manager's reply does not wait on it.
+        context.application.create_task(self._notify_engineer(context, engineer, summary))
         await update.message.reply_text(
             f"{call_id} дуудлагыг {engineer.name} инженерт оноолоо.\n\n" + summary
         )
 
-        await self._notify_engineer(context, engineer, summary)
-
     async def cancel(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> ConversationState | int:
         await update.message.reply_text(
             "Яриа цуцлагдлаа. /start командыг ашиглан дахин эхлүүлж болно.",
-            reply_markup=ReplyKeyboardRemove(),
+            reply_markup=REMOVE_KEYBOARD,
         )
         return ConversationHandler.END
 
@@ -710,43 +1019,78 @@ class BotHandler:
 def build_application(config: BotConfig, database: Database, ai: AIAssistant) -> Application:
     handler = BotHandler(config, database, ai)
 
-    conversation = ConversationHandler(
-        entry_points=[CommandHandler("start", handler.start)],
-        states={
-            ConversationState.ASK_EMPLOYEE_CODE: [
-                MessageHandler(
-                    filters.TEXT & ~filters.COMMAND, handler.receive_employee_code
-                )
-            ],
-            ConversationState.CHOOSE_ISSUE: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handler.choose_issue)
-            ],
-            ConversationState.BASIC_FOLLOWUP: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handler.handle_basic_followup)
-            ],
-            ConversationState.REQUEST_DETAILS: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handler.request_details)
-            ],
-            ConversationState.AI_FOLLOWUP: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handler.handle_ai_followup)
-            ],
-        },
-        fallbacks=[CommandHandler("cancel", handler.cancel)],
-        allow_reentry=True,
-    )
+    # The issue buttons are only valid while the chat is choosing an issue, so
+    # tracking callbacks per chat (per_message=False) is intended; PTB warns
+    # about that combination regardless.
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", message="If 'per_message=False'", category=PTBUserWarning
+        )
+        conversation = ConversationHandler(
+            entry_points=[CommandHandler("start", handler.start)],
+            states={
+                ConversationState.ASK_EMPLOYEE_CODE: [
+                    MessageHandler(TEXT_MESSAGE, handler.receive_employee_code)
+                ],
+                ConversationState.CHOOSE_ISSUE: [
+                    CallbackQueryHandler(handler.choose_issue_button, pattern=r"^issue:"),
+                    MessageHandler(TEXT_MESSAGE, handler.choose_issue),
+                ],
+                ConversationState.BASIC_FOLLOWUP: [
+                    MessageHandler(TEXT_MESSAGE, handler.handle_basic_followup)
+                ],
+                ConversationState.REQUEST_DETAILS: [
+                    MessageHandler(TEXT_MESSAGE, handler.request_details)
+                ],
+                ConversationState.AI_FOLLOWUP: [
+                    MessageHandler(TEXT_MESSAGE, handler.handle_ai_followup)
+                ],
+            },
+            fallbacks=[CommandHandler("cancel", handler.cancel)],
+            allow_reentry=True,
+        )
 
-    application = Application.builder().token(config.telegram_token).build()
-    application.add_handler(CallbackQueryHandler(handler.handle_report_callback, pattern=r"^report:"))
-    application.add_handler(
-        MessageHandler(
-            filters.TEXT & filters.User(config.manager_chat_id),
-            handler.receive_report_range,
+    async def _shutdown(_: Application) -> None:
+        await ai.aclose()
+
+    try:  # Optional HTTP/2 support lets concurrent Bot API calls share connections.
+        import h2  # noqa: F401
+    except ImportError:  # pragma: no cover - optional dependency
+        http_version = "1.1"
+    else:
+        http_version = "2"
+
+    application = (
+        Application.builder()
+        .token(config.telegram_token)
+        .post_shutdown(_shutdown)
+        .concurrent_updates(PerChatUpdateProcessor(MAX_CONCURRENT_UPDATES))
+        # One pooled connection per concurrently processed update.
+        .request(
+            TelegramRequest(
+                connection_pool_size=MAX_CONCURRENT_UPDATES, http_version=http_version
+            )
         )
+        .get_updates_request(TelegramRequest(http_version=http_version))
+        .build()
+    )
+    # Registered in one call; the order is significant because the first
+    # matching handler in the group wins.
+    application.add_handlers(
+        [
+            CallbackQueryHandler(handler.handle_report_callback, pattern=r"^report:"),
+            MessageHandler(
+                filters.TEXT & filters.User(config.manager_chat_id),
+                handler.receive_report_range,
+            ),
+            conversation,
+            # Reached only when the conversation is not choosing an issue.
+            CallbackQueryHandler(handler.expired_issue_button, pattern=r"^issue:"),
+            CommandHandler("report", handler.report),
+            CommandHandler("add_employee", handler.add_employee),
+            CommandHandler("assign_call", handler.assign_call),
+        ]
     )
-    application.add_handler(conversation)
-    application.add_handler(CommandHandler("report", handler.report))
-    application.add_handler(CommandHandler("add_employee", handler.add_employee))
-    application.add_handler(CommandHandler("assign_call", handler.assign_call))
 
     return application
 
@@ -2,33 +2,79 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from pathlib import Path
+import os
+from urllib.parse import urlsplit
 
 from .ai import AIAssistant
 from .config import load_config, load_env_file
 from .database import Database
-from .handlers import build_application
 
 
+# Computed once at import; plain string operations avoid pathlib objects and
+# the realpath syscall chain of ``Path.resolve``.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The log format uses none of these record attributes, so skip collecting
+# them (thread name, process id, multiprocessing name) for every record.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
 
 
+def _install_uvloop() -> None:
+    try:  # Optional libuv-based event loop; not available on Windows.
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
+    # Install the loop policy before anything (config, clients, PTB) can
+    # create or cache an event loop.
+    _install_uvloop()
+
+    # python-telegram-bot is only imported once the bot is actually started,
+    # so importing this module (e.g. from a health check) stays cheap.
+    from .handlers import build_application
+
     # Load optional .env configuration before reading environment variables.
-    project_root = Path(__file__).resolve().parent.parent
-    load_env_file(str(project_root / ".env"))
-    if Path.cwd().resolve() != project_root:
+    load_env_file(os.path.join(_PROJECT_ROOT, ".env"))
+    if os.getcwd() != _PROJECT_ROOT:
         load_env_file(".env")
 
     config = load_config()
-    database = Database(config.database_path)
-    assistant = AIAssistant(config.openai_api_key, model=config.openai_model)
+    database = Database(
+        config.database_path,
+        flush_interval=config.database_flush_interval or None,
+    )
+    assistant = AIAssistant(
+        config.openai_api_key,
+        model=config.openai_model,
+        max_concurrency=config.openai_max_concurrency,
+    )
     application = build_application(config, database, assistant)
-    application.run_polling()
+    try:
+        if config.webhook_url:
+            # PTB's webhook server queues each update and answers Telegram
+            # with 200 before any handler runs.
+            application.run_webhook(
+                listen=config.webhook_listen,
+                port=config.webhook_port,
+                url_path=urlsplit(config.webhook_url).path.lstrip("/"),
+                webhook_url=config.webhook_url,
+                secret_token=config.webhook_secret,
+            )
+        else:
+            application.run_polling()
+    finally:
+        database.close()
 
 
 if __name__ == "__main__":  # pragma: no cover - script entry point